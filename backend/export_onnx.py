@@ -0,0 +1,67 @@
+"""
+Export the trained XGBoost regressor to ONNX so the API can serve it with ONNX Runtime.
+
+Requires the optional packages onnxmltools and onnxruntime:
+    pip install onnxmltools onnxruntime
+
+The API picks up ideal_temperature_model.onnx automatically when onnxruntime is
+installed; otherwise it keeps predicting with the XGBoost booster.
+"""
+import joblib
+import numpy as np
+import onnxmltools
+import onnxruntime as ort
+from onnxmltools.convert.common.data_types import FloatTensorType
+import os
+
+def export_model(model_filename='ideal_temperature_model.joblib', onnx_filename='ideal_temperature_model.onnx'):
+    """
+    Convert the regressor of the trained pipeline to ONNX and check it against XGBoost.
+    
+    Args:
+        model_filename (str): Path to the trained joblib pipeline
+        onnx_filename (str): Path to write the ONNX model to
+    """
+    if not os.path.exists(model_filename):
+        raise FileNotFoundError(f"Model file '{model_filename}' not found. Please train the model first.")
+    
+    print(f"Loading model from: {model_filename}")
+    pipeline = joblib.load(model_filename)
+    regressor = pipeline.named_steps['regressor']
+    n_features = regressor.get_booster().num_features()
+    
+    # The API feeds the preprocessed (one-hot encoded) float32 matrix
+    onnx_model = onnxmltools.convert_xgboost(
+        regressor,
+        initial_types=[('input', FloatTensorType([None, n_features]))]
+    )
+    
+    # Write to a temporary file so the API never picks up an unverified export
+    tmp_filename = onnx_filename + '.tmp'
+    onnxmltools.utils.save_model(onnx_model, tmp_filename)
+    try:
+        # Verify that ONNX Runtime reproduces the XGBoost predictions
+        rng = np.random.default_rng(42)
+        sample = rng.uniform(0, 1000, size=(256, n_features)).astype(np.float32)
+        expected = regressor.get_booster().inplace_predict(sample)
+        session = ort.InferenceSession(tmp_filename, providers=['CPUExecutionProvider'])
+        actual = session.run(None, {session.get_inputs()[0].name: sample})[0].ravel()
+        max_error = float(np.max(np.abs(expected - actual)))
+        print(f"Max prediction difference vs XGBoost: {max_error:.6f}°C")
+        if max_error > 1e-3:
+            raise ValueError(f"ONNX predictions differ from XGBoost by up to {max_error:.6f}°C")
+    except Exception:
+        os.remove(tmp_filename)
+        raise
+    
+    os.replace(tmp_filename, onnx_filename)
+    print(f"ONNX model saved as: {onnx_filename}")
+    print(f"File size: {os.path.getsize(onnx_filename) / 1024 / 1024:.2f} MB")
+
+if __name__ == "__main__":
+    try:
+        export_model()
+        print(f"\n🎉 SUCCESS! ONNX export completed successfully!")
+        print(f"🚀 Restart the Flask API to serve predictions with ONNX Runtime")
+    except Exception as e:
+        print(f"\n❌ ERROR: {str(e)}")
@@ -1,21 +1,99 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from flask_cors import CORS
-import pandas as pd
 import joblib
+import msgspec
+import orjson
 import numpy as np
 import logging
-from datetime import datetime
+import logging.handlers
+from itertools import chain
+from operator import attrgetter
+from datetime import datetime, timezone
 import os
+import queue
+import threading
+import time
+from typing import Annotated, Literal
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: records are written directly until a server worker switches
+# to queued logging, where request threads only enqueue records
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_queue_handler = None
+_log_listener = None
+
+def start_queued_logging():
+    """
+    Hand log output to a listener thread so request threads never wait on stream I/O.
+    
+    Called once per worker process from Gunicorn's post_fork hook, never at import:
+    a listener started in the preloaded master would be copied into every worker.
+    """
+    global _queue_handler, _log_listener
+    root_logger = logging.getLogger()
+    if _log_listener is not None or _log_handler not in root_logger.handlers:
+        return
+    
+    log_queue = queue.Queue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _log_listener = logging.handlers.QueueListener(log_queue, _log_handler)
+    _log_listener.start()
+    root_logger.addHandler(_queue_handler)
+    root_logger.removeHandler(_log_handler)
+
+def stop_queued_logging():
+    """Switch back to direct logging and flush the records still queued."""
+    global _queue_handler, _log_listener
+    if _log_listener is None:
+        return
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_log_handler)
+    root_logger.removeHandler(_queue_handler)
+    _log_listener.stop()
+    _queue_handler = None
+    _log_listener = None
+
+root_logger = logging.getLogger()
+if not root_logger.handlers:
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(_log_handler)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 CORS(app, origins=["https://smart-ac-two.vercel.app"])  # Allow requests from Vercel frontend
 
+def ojson(obj, status=200):
+    """Serialize obj with orjson into a JSON response."""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
 # Global variables to store model and feature info
 model_pipeline = None
+booster = None
+onnx_model_path = None  # Up-to-date ONNX export found by load_model, opened per process
+onnx_session = None
+onnx_input_name = None
+
+# Column layout of the preprocessed feature vector, built from the fitted pipeline
+numerical_columns = np.empty(0, dtype=np.intp)
+numerical_values = None  # tuple_getter returning a row's numerical features as a tuple in column order
+categorical_values = None  # tuple_getter returning a row's categorical features as a tuple
+category_lookups = ()  # Bound dict.get of each categorical feature's category -> column map
+
+# Reusable input matrix of MAX_BATCH_SIZE rows, only touched by the batching thread
+_feature_buffer = np.zeros((0, 0), dtype=np.float32)
+
+# /model-info response body, serialized once when the model is loaded
+_model_info_body = None
+
+# Cached response timestamp and the epoch second it was formatted for
+_now_iso = ''
+_now_iso_second = None
+
+# /health response body and the (timestamp, model_loaded) it was serialized for
+_health_body = b''
+_health_key = None
+
 expected_features = [
     'Indoor_Temperature', 'Outdoor_Temperature', 'Humidity', 'Occupancy',
     'Weather_Condition', 'Time_of_Day', 'Sunlight_Intensity', 'Room_Size', 'Window_State'
@@ -29,68 +107,403 @@ valid_categories = {
     'Window_State': ['Open', 'Closed']
 }
 
+class PredictionInput(msgspec.Struct):
+    """Schema of the /predict request body, validated while decoding."""
+    Indoor_Temperature: float
+    Outdoor_Temperature: float
+    Humidity: Annotated[int, msgspec.Meta(ge=0, le=100)]
+    Occupancy: Annotated[int, msgspec.Meta(ge=0)]
+    Weather_Condition: Literal[tuple(valid_categories['Weather_Condition'])]
+    Time_of_Day: Literal[tuple(valid_categories['Time_of_Day'])]
+    Sunlight_Intensity: Annotated[int, msgspec.Meta(ge=0)]
+    Room_Size: Literal[tuple(valid_categories['Room_Size'])]
+    Window_State: Literal[tuple(valid_categories['Window_State'])]
+
+class PredictionOutput(msgspec.Struct):
+    """Successful /predict response body."""
+    predicted_ideal_temperature: float
+    timestamp: str
+    status: str = 'success'
+
+_input_decoder = msgspec.json.Decoder(PredictionInput)
+_output_encoder = msgspec.json.Encoder()
+
+# Dynamic batching settings: concurrent /predict requests are coalesced into
+# a single model call of at most MAX_BATCH_SIZE rows, waiting at most
+# MAX_WAIT_TIME seconds for the batch to fill up.
+MAX_BATCH_SIZE = 64
+MAX_WAIT_TIME = 0.01
+REQUEST_TIMEOUT = 5.0
+
+# XGBoost predicts single-threaded (concurrency comes from the Gunicorn workers)
+# unless a coalesced batch is large enough to pay for spinning up more threads.
+PARALLEL_BATCH_THRESHOLD = 32
+PARALLEL_PREDICT_THREADS = os.cpu_count() or 1
+_booster_nthread = 1
+
+_batch_queue = queue.Queue()
+_batch_thread = None
+_batch_thread_lock = threading.Lock()
+
+def _batch_worker():
+    """Drain queued prediction requests and run them as one batch."""
+    open_onnx_session()
+    while True:
+        batch = [_batch_queue.get()]
+        deadline = time.monotonic() + MAX_WAIT_TIME
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_batch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        try:
+            features = encode_features([data for data, _, _ in batch])
+            predictions = predict_features(features)
+            for (_, event, slot), prediction in zip(batch, predictions):
+                slot['prediction'] = float(prediction)
+                event.set()
+        except Exception as e:
+            for _, event, slot in batch:
+                slot['error'] = e
+                event.set()
+
+def build_feature_layout(pipeline):
+    """
+    Map each input feature to its column in the preprocessed feature vector.
+    
+    Args:
+        pipeline (sklearn.pipeline.Pipeline): Fitted preprocessing + regressor pipeline
+        
+    Returns:
+        tuple: (n_features, numerical_index, categorical_index) where
+            numerical_index maps feature -> column and categorical_index
+            maps feature -> {category: one-hot column}
+    """
+    preprocessor = pipeline.named_steps['preprocessor']
+    numerical_index = {}
+    categorical_index = {}
+    column = 0
+    
+    # ColumnTransformer stacks its outputs in the order of its transformers
+    for name, transformer, columns in preprocessor.transformers_:
+        if name == 'cat':
+            for feature, categories in zip(columns, transformer.categories_):
+                categorical_index[feature] = {}
+                for category in categories:
+                    categorical_index[feature][str(category)] = column
+                    column += 1
+        elif name == 'num':
+            for feature in columns:
+                numerical_index[feature] = column
+                column += 1
+    
+    return column, numerical_index, categorical_index
+
+def tuple_getter(names):
+    """
+    Build a getter returning the named attributes of an object as a tuple.
+    
+    Unlike attrgetter, the result is a tuple for any number of names, so
+    models trained on a single numerical or categorical feature encode correctly.
+    
+    Args:
+        names (iterable): Attribute names, in the order to return them
+        
+    Returns:
+        callable: Function mapping an object to a tuple of attribute values
+    """
+    names = tuple(names)
+    if len(names) == 0:
+        return lambda obj: ()
+    if len(names) == 1:
+        name = names[0]
+        return lambda obj: (getattr(obj, name),)
+    return attrgetter(*names)
+
+def encode_features(rows):
+    """
+    Build the model input matrix for validated inputs without going through pandas/sklearn.
+    
+    Args:
+        rows (list): Validated PredictionInput structs
+        
+    Returns:
+        numpy.ndarray: float32 matrix with one row per input and one column per
+            preprocessed feature, a view of the shared feature buffer valid until the next call
+    """
+    n_rows = len(rows)
+    features = _feature_buffer[:n_rows]
+    features.fill(0.0)
+    
+    # Gather numerical values and one-hot columns row by row, then scatter them in one go
+    n_numerical = len(numerical_columns)
+    numerical = np.fromiter(
+        chain.from_iterable(map(numerical_values, rows)),
+        dtype=np.float32, count=n_rows * n_numerical
+    ).reshape(n_rows, n_numerical)
+    n_categorical = len(category_lookups)
+    onehot_columns = np.fromiter(
+        (lookup(value, -1) for data in rows for lookup, value in zip(category_lookups, categorical_values(data))),
+        dtype=np.intp, count=n_rows * n_categorical
+    ).reshape(n_rows, n_categorical)
+    features[:, numerical_columns] = numerical
+    
+    # Unknown categories (-1) stay all-zero, like OneHotEncoder(handle_unknown='ignore')
+    known = onehot_columns >= 0
+    features[np.nonzero(known)[0], onehot_columns[known]] = 1.0
+    return features
+
+def find_onnx_model(onnx_filename, model_filename):
+    """
+    Check for an ONNX export that is up to date with the joblib model.
+    
+    Only looks at the files: ONNX Runtime itself is loaded per process by
+    open_onnx_session, since loading it in the preloaded Gunicorn master keeps
+    workers from shutting down on SIGTERM.
+    
+    Args:
+        onnx_filename (str): Path to the model exported by export_onnx.py
+        model_filename (str): Path to the joblib pipeline the export must be up to date with
+        
+    Returns:
+        str or None: onnx_filename, or None if there is no usable export
+    """
+    if not os.path.exists(onnx_filename):
+        return None
+    
+    # An export older than the joblib model belongs to a previous training run
+    if os.path.getmtime(onnx_filename) < os.path.getmtime(model_filename):
+        logger.warning(f"Ignoring '{onnx_filename}': it is older than '{model_filename}'. Re-run export_onnx.py to use ONNX Runtime.")
+        return None
+    return onnx_filename
+
+def load_onnx_session(onnx_filename, n_features):
+    """
+    Open an ONNX Runtime session for the exported model.
+    
+    Args:
+        onnx_filename (str): Path to the model exported by export_onnx.py
+        n_features (int): Number of columns produced by the preprocessor
+        
+    Returns:
+        onnxruntime.InferenceSession or None: Session, or None if ONNX Runtime
+            is not installed or the model cannot be opened
+    """
+    try:
+        import onnxruntime as ort
+    except ImportError:  # ONNX Runtime is optional; predictions fall back to the XGBoost booster
+        logger.warning(f"Found '{onnx_filename}' but onnxruntime is not installed, falling back to XGBoost")
+        return None
+    
+    # Single-threaded like the booster; the Gunicorn workers provide the parallelism
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    try:
+        session = ort.InferenceSession(onnx_filename, sess_options=options, providers=['CPUExecutionProvider'])
+        input_shape = session.get_inputs()[0].shape
+        if input_shape[-1] != n_features:
+            raise ValueError(f"ONNX model expects {input_shape[-1]} features, preprocessor produces {n_features}")
+    except Exception as e:
+        logger.error(f"Error loading ONNX model, falling back to XGBoost: {str(e)}")
+        return None
+    return session
+
+def open_onnx_session():
+    """Open this process's ONNX Runtime session, called from the batching thread before its first batch."""
+    global onnx_session, onnx_input_name, _model_info_body
+    if onnx_model_path is None or onnx_session is not None:
+        return
+    
+    session = load_onnx_session(onnx_model_path, booster.num_features())
+    if session is None:
+        # /model-info was serialized at load time assuming ONNX Runtime would be used
+        _model_info_body = orjson.dumps(build_model_info(model_pipeline, 'xgboost'))
+        return
+    onnx_input_name = session.get_inputs()[0].name
+    onnx_session = session
+
+def predict_features(features):
+    """
+    Run the model on an encoded feature matrix.
+    
+    Args:
+        features (numpy.ndarray): float32 matrix from encode_features
+        
+    Returns:
+        numpy.ndarray: One prediction per row
+    """
+    global _booster_nthread
+    if onnx_session is not None:
+        return onnx_session.run(None, {onnx_input_name: features})[0].ravel()
+    
+    nthread = PARALLEL_PREDICT_THREADS if len(features) > PARALLEL_BATCH_THRESHOLD else 1
+    if nthread != _booster_nthread:
+        booster.set_param({'nthread': nthread})
+        _booster_nthread = nthread
+    return booster.inplace_predict(features)
+
+def build_model_info(pipeline, runtime):
+    """
+    Collect the static model description served by /model-info.
+    
+    Args:
+        pipeline (sklearn.pipeline.Pipeline): Fitted preprocessing + regressor pipeline
+        runtime (str): Name of the runtime serving predictions
+        
+    Returns:
+        dict: Model information
+    """
+    # Get feature names after preprocessing
+    categorical_features = ['Weather_Condition', 'Time_of_Day', 'Room_Size', 'Window_State']
+    numerical_features = ['Indoor_Temperature', 'Outdoor_Temperature', 'Humidity', 
+                        'Occupancy', 'Sunlight_Intensity']
+    
+    feature_names = (
+        list(pipeline.named_steps['preprocessor']
+             .named_transformers_['cat']
+             .get_feature_names_out(categorical_features)) +
+        numerical_features
+    )
+    
+    return {
+        'model_type': 'XGBoost Regressor',
+        'inference_runtime': runtime,
+        'expected_features': expected_features,
+        'valid_categories': valid_categories,
+        'total_features_after_preprocessing': len(feature_names),
+        'feature_names_after_preprocessing': feature_names[:10],  # Show first 10
+        'model_parameters': {
+            'n_estimators': pipeline.named_steps['regressor'].n_estimators,
+            'max_depth': pipeline.named_steps['regressor'].max_depth,
+            'learning_rate': pipeline.named_steps['regressor'].learning_rate
+        }
+    }
+
+def start_batch_worker():
+    """
+    Start the batching thread if it is not already running in this process.
+    
+    Called lazily from batched_predict, never at import: a thread (gevent greenlet)
+    started in the preloaded Gunicorn master would be copied into every worker.
+    """
+    global _batch_thread
+    with _batch_thread_lock:
+        if _batch_thread is None or not _batch_thread.is_alive():
+            _batch_thread = threading.Thread(target=_batch_worker, name='batch-predictor', daemon=True)
+            _batch_thread.start()
+
+def batched_predict(data):
+    """
+    Queue a validated input for the batching thread and wait for its prediction.
+    
+    Args:
+        data (PredictionInput): Validated input features
+        
+    Returns:
+        float: Predicted ideal temperature
+    """
+    start_batch_worker()
+    event = threading.Event()
+    slot = {}
+    _batch_queue.put((data, event, slot))
+    if not event.wait(timeout=REQUEST_TIMEOUT):
+        raise TimeoutError(f"Prediction not completed within {REQUEST_TIMEOUT} seconds")
+    if 'error' in slot:
+        raise slot['error']
+    return slot['prediction']
+
+def now_iso():
+    """Current UTC time as a second-resolution ISO 8601 string, formatted at most once per second."""
+    global _now_iso, _now_iso_second
+    second = int(time.time())
+    if second != _now_iso_second:
+        _now_iso = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        _now_iso_second = second
+    return _now_iso
+
 def load_model():
-    """Load the trained model pipeline."""
-    global model_pipeline
+    """Load the trained model pipeline and its raw XGBoost booster, and look for an ONNX export."""
+    global model_pipeline, booster, onnx_model_path, onnx_session, onnx_input_name, _booster_nthread
+    global numerical_columns, numerical_values, categorical_values, category_lookups
+    global _feature_buffer, _model_info_body
     try:
         model_filename = 'ideal_temperature_model.joblib'
         if not os.path.exists(model_filename):
             raise FileNotFoundError(f"Model file '{model_filename}' not found. Please train the model first.")
         
-        model_pipeline = joblib.load(model_filename)
-        logger.info("Model loaded successfully")
+        pipeline = joblib.load(model_filename)
+        
+        # Predict with the booster directly to skip per-call pandas/sklearn overhead
+        n_features, numerical_index, categorical_index = build_feature_layout(pipeline)
+        raw_booster = pipeline.named_steps['regressor'].get_booster()
+        if raw_booster.num_features() != n_features:
+            raise ValueError(f"Model expects {raw_booster.num_features()} features, preprocessor produces {n_features}")
+        raw_booster.set_param({'nthread': 1})
+        
+        # Prefer ONNX Runtime when the model has been exported with export_onnx.py;
+        # the session itself is opened per process by the batching thread
+        onnx_path = find_onnx_model('ideal_temperature_model.onnx', model_filename)
+        runtime = 'onnxruntime' if onnx_path is not None else 'xgboost'
+        
+        # The model description never changes between restarts, so serialize it once
+        model_info_body = orjson.dumps(build_model_info(pipeline, runtime))
+        
+        model_pipeline = pipeline
+        booster = raw_booster
+        _booster_nthread = 1
+        onnx_model_path = onnx_path
+        onnx_session = None
+        onnx_input_name = None
+        numerical_columns = np.fromiter(numerical_index.values(), dtype=np.intp, count=len(numerical_index))
+        numerical_values = tuple_getter(numerical_index)
+        categorical_values = tuple_getter(categorical_index)
+        category_lookups = tuple(lookup.get for lookup in categorical_index.values())
+        _feature_buffer = np.zeros((MAX_BATCH_SIZE, n_features), dtype=np.float32)
+        _model_info_body = model_info_body
+        logger.info(f"Model loaded successfully (runtime: {runtime})")
         return True
     except Exception as e:
         logger.error(f"Error loading model: {str(e)}")
         return False
 
-def validate_input(data):
+def validate_input(body):
     """
-    Validate input data format and values.
+    Decode and validate a raw /predict request body in a single pass.
     
     Args:
-        data (dict): Input data to validate
+        body (bytes): Raw JSON request body
         
     Returns:
-        tuple: (is_valid, error_message)
+        tuple: (prediction_input, error_message)
     """
-    # Check if all required features are present
-    missing_features = [feature for feature in expected_features if feature not in data]
-    if missing_features:
-        return False, f"Missing required features: {missing_features}"
-    
-    # Check data types and ranges
     try:
-        # Validate numerical features
-        if not isinstance(data['Indoor_Temperature'], (int, float)):
-            return False, "Indoor_Temperature must be a number"
-        if not isinstance(data['Outdoor_Temperature'], (int, float)):
-            return False, "Outdoor_Temperature must be a number"
-        if not isinstance(data['Humidity'], int) or not (0 <= data['Humidity'] <= 100):
-            return False, "Humidity must be an integer between 0 and 100"
-        if not isinstance(data['Occupancy'], int) or data['Occupancy'] < 0:
-            return False, "Occupancy must be a non-negative integer"
-        if not isinstance(data['Sunlight_Intensity'], int) or data['Sunlight_Intensity'] < 0:
-            return False, "Sunlight_Intensity must be a non-negative integer"
-        
-        # Validate categorical features
-        for cat_feature, valid_values in valid_categories.items():
-            if data[cat_feature] not in valid_values:
-                return False, f"{cat_feature} must be one of: {valid_values}"
-        
-        return True, None
-        
-    except Exception as e:
-        return False, f"Data validation error: {str(e)}"
+        return _input_decoder.decode(body), None
+    except msgspec.ValidationError as e:
+        return None, f"Invalid input: {e}"
+    except msgspec.DecodeError:
+        return None, "Request body is not valid JSON"
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'model_loaded': model_pipeline is not None
-    })
+    global _health_body, _health_key
+    
+    # Reserialize only when the (second-resolution) timestamp or model state changes
+    key = (now_iso(), model_pipeline is not None)
+    if key != _health_key:
+        timestamp, model_loaded = key
+        _health_body = orjson.dumps({
+            'status': 'healthy',
+            'timestamp': timestamp,
+            'model_loaded': model_loaded
+        })
+        _health_key = key
+    return app.response_class(_health_body, mimetype='application/json')
 
 @app.route('/predict', methods=['POST'])
 def predict_temperature():
@@ -113,87 +526,53 @@ def predict_temperature():
     try:
         # Check if model is loaded
         if model_pipeline is None:
-            return jsonify({
+            return ojson({
                 'error': 'Model not loaded. Please ensure the model file exists and restart the server.'
-            }), 500
+            }, 500)
         
         # Get JSON data from request
         if not request.is_json:
-            return jsonify({'error': 'Request must be JSON'}), 400
+            return ojson({'error': 'Request must be JSON'}, 400)
         
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No JSON data provided'}), 400
+        body = request.get_data()
+        if not body:
+            return ojson({'error': 'No JSON data provided'}, 400)
         
-        # Validate input data
-        is_valid, error_message = validate_input(data)
-        if not is_valid:
-            return jsonify({'error': error_message}), 400
+        # Decode and validate input data
+        data, error_message = validate_input(body)
+        if error_message:
+            return ojson({'error': error_message}, 400)
         
-        # Create DataFrame for prediction
-        input_df = pd.DataFrame([data])
+        # Make prediction (batched together with concurrent requests)
+        predicted_temperature = batched_predict(data)
         
-        # Make prediction
-        prediction = model_pipeline.predict(input_df)
-        predicted_temperature = float(prediction[0])
-        
-        # Log the prediction
-        logger.info(f"Prediction made: {predicted_temperature:.2f}°C for input: {data}")
+        # Log the prediction (skip building the message when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Prediction made: %.2f°C for input: %s", predicted_temperature, data)
         
         # Return prediction
-        response = {
-            'predicted_ideal_temperature': round(predicted_temperature, 2),
-            'input_features': data,
-            'timestamp': datetime.now().isoformat(),
-            'status': 'success'
-        }
+        response = PredictionOutput(
+            predicted_ideal_temperature=round(predicted_temperature, 2),
+            timestamp=now_iso()
+        )
         
-        return jsonify(response)
+        return app.response_class(_output_encoder.encode(response), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}")
-        return jsonify({
+        return ojson({
             'error': f'Prediction failed: {str(e)}',
             'status': 'error',
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'timestamp': now_iso()
+        }, 500)
 
 @app.route('/model-info', methods=['GET'])
 def model_info():
     """Get information about the loaded model."""
-    if model_pipeline is None:
-        return jsonify({'error': 'Model not loaded'}), 500
+    if _model_info_body is None:
+        return ojson({'error': 'Model not loaded'}, 500)
     
-    try:
-        # Get feature names after preprocessing
-        categorical_features = ['Weather_Condition', 'Time_of_Day', 'Room_Size', 'Window_State']
-        numerical_features = ['Indoor_Temperature', 'Outdoor_Temperature', 'Humidity', 
-                            'Occupancy', 'Sunlight_Intensity']
-        
-        feature_names = (
-            list(model_pipeline.named_steps['preprocessor']
-                 .named_transformers_['cat']
-                 .get_feature_names_out(categorical_features)) +
-            numerical_features
-        )
-        
-        model_info_dict = {
-            'model_type': 'XGBoost Regressor',
-            'expected_features': expected_features,
-            'valid_categories': valid_categories,
-            'total_features_after_preprocessing': len(feature_names),
-            'feature_names_after_preprocessing': feature_names[:10],  # Show first 10
-            'model_parameters': {
-                'n_estimators': model_pipeline.named_steps['regressor'].n_estimators,
-                'max_depth': model_pipeline.named_steps['regressor'].max_depth,
-                'learning_rate': model_pipeline.named_steps['regressor'].learning_rate
-            }
-        }
-        
-        return jsonify(model_info_dict)
-        
-    except Exception as e:
-        return jsonify({'error': f'Error getting model info: {str(e)}'}), 500
+    return app.response_class(_model_info_body, mimetype='application/json')
 
 @app.route('/', methods=['GET'])
 def home():
@@ -225,23 +604,22 @@ def home():
         },
         'sample_response': {
             'predicted_ideal_temperature': 24.85,
-            'input_features': '...',
-            'timestamp': '2024-01-01T12:00:00',
+            'timestamp': '2024-01-01T12:00:00Z',
             'status': 'success'
         }
     }
     
-    return jsonify(documentation)
+    return ojson(documentation)
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return ojson({'error': 'Endpoint not found'}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojson({'error': 'Internal server error'}, 500)
 
 # Load the model when the application module is loaded (e.g., by Gunicorn)
 if not load_model():
@@ -253,5 +631,6 @@ if __name__ == '__main__':
     print("API Documentation available at: http://localhost:5000/")
     print("Health check available at: http://localhost:5000/health")
     print("Prediction endpoint: http://localhost:5000/predict")
+    print("For production, run: gunicorn -c gunicorn.conf.py wsgi:app")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Gunicorn settings for the ideal temperature prediction API."""
+import gc
+import multiprocessing
+import os
+import sys
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# gevent workers let many in-flight requests share a worker while the model runs
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_connections = 1000
+
+# Load the app (and model) once in the master; workers share it copy-on-write
+preload_app = True
+
+def pre_fork(server, worker):
+    """Freeze the preloaded objects so workers keep sharing their memory pages."""
+    # Objects in the permanent generation are never scanned by the garbage collector,
+    # so a worker's collections do not write to (and copy) the parent's model pages
+    gc.freeze()
+
+def post_fork(server, worker):
+    """Start this worker's log listener thread."""
+    # Only the preloaded app is touched here; without preload_app the worker imports it later
+    flask_api = sys.modules.get('flask_api')
+    if flask_api is not None:
+        flask_api.start_queued_logging()
+
+def worker_exit(server, worker):
+    """Flush this worker's queued log records before it exits."""
+    flask_api = sys.modules.get('flask_api')
+    if flask_api is not None:
+        flask_api.stop_queued_logging()
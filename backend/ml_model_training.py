@@ -7,16 +7,72 @@ from sklearn.pipeline import Pipeline
 from sklearn.metrics import r2_score, mean_absolute_error
 import xgboost as xgb
 import joblib
+import json
 import warnings
 import os
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; fall back to pandas' CSV parser
+    pa = None
+
+def read_dataset(file_path):
+    """
+    Read the dataset, using pyarrow's multithreaded CSV parser and a Parquet cache when available.
+    
+    Args:
+        file_path (str): Path to a CSV or Parquet file
+        
+    Returns:
+        pandas.DataFrame: Raw dataset
+    """
+    if file_path.endswith('.parquet'):
+        return pd.read_parquet(file_path)
+    
+    if pa is None:
+        return pd.read_csv(file_path)
+    
+    # Reuse the Parquet copy from a previous run while the CSV is unchanged
+    cache_path = os.path.splitext(file_path)[0] + '.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        print(f"Using cached Parquet dataset: {cache_path}")
+        return pq.read_table(cache_path).to_pandas()
+    
+    # Declared column types let the parser skip type inference. Humidity, Occupancy and
+    # Sunlight_Intensity are left to inference: they are integers, but pandas writes them
+    # as floats ('55.0') when the column has missing values
+    column_types = {
+        'Indoor_Temperature': pa.float64(),
+        'Outdoor_Temperature': pa.float64(),
+        'Weather_Condition': pa.string(),
+        'Time_of_Day': pa.string(),
+        'Room_Size': pa.string(),
+        'Window_State': pa.string(),
+        'Ideal_Temperature': pa.float64()
+    }
+    table = pacsv.read_csv(
+        file_path,
+        # Blank cells become nulls (NaN), as with pd.read_csv, rather than '' strings
+        convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    )
+    
+    try:
+        pq.write_table(table, cache_path)
+        print(f"Cached parsed dataset as: {cache_path}")
+    except OSError as e:
+        print(f"WARNING: Could not write Parquet cache: {str(e)}")
+    
+    return table.to_pandas()
+
 def load_and_validate_dataset(file_path):
     """
-    Load and validate the dataset from CSV file.
+    Load and validate the dataset from CSV (or cached Parquet) file.
     
     Args:
-        file_path (str): Path to the CSV file
+        file_path (str): Path to the CSV or Parquet file
         
     Returns:
         pandas.DataFrame: Loaded and validated dataset
@@ -28,7 +84,7 @@ def load_and_validate_dataset(file_path):
     try:
         # Load the dataset
         print(f"Loading dataset from: {file_path}")
-        df = pd.read_csv(file_path)
+        df = read_dataset(file_path)
         print(f"Dataset loaded successfully!")
         
     except Exception as e:
@@ -134,22 +190,30 @@ def clean_dataset(df):
     critical_columns = ['Indoor_Temperature', 'Outdoor_Temperature', 'Ideal_Temperature']
     df_clean = df.dropna(subset=critical_columns)
     
-    # Fill missing values in other columns if needed
-    if 'Humidity' in df.columns:
-        df_clean['Humidity'] = df_clean['Humidity'].fillna(df_clean['Humidity'].median())
+    # Fill missing values in other columns if needed (medians of all columns in one NumPy pass)
+    median_columns = [col for col in ['Humidity', 'Sunlight_Intensity'] if col in df.columns]
+    if median_columns:
+        values = df_clean[median_columns].to_numpy(dtype=float)
+        missing = np.isnan(values)
+        filled = missing.any(axis=0)
+        if filled.any():
+            medians = np.nanmedian(values, axis=0)
+            values[missing] = np.take(medians, np.nonzero(missing)[1])
+            # Only write back columns that had gaps, so complete integer columns keep their dtype
+            df_clean[[col for col, has_gaps in zip(median_columns, filled) if has_gaps]] = values[:, filled]
     
     if 'Occupancy' in df.columns:
         df_clean['Occupancy'] = df_clean['Occupancy'].fillna(0)
     
-    if 'Sunlight_Intensity' in df.columns:
-        df_clean['Sunlight_Intensity'] = df_clean['Sunlight_Intensity'].fillna(df_clean['Sunlight_Intensity'].median())
-    
-    # Remove extreme outliers (optional)
-    for col in ['Indoor_Temperature', 'Outdoor_Temperature', 'Ideal_Temperature']:
-        if col in df_clean.columns:
-            Q1 = df_clean[col].quantile(0.01)
-            Q3 = df_clean[col].quantile(0.99)
-            df_clean = df_clean[(df_clean[col] >= Q1) & (df_clean[col] <= Q3)]
+    # Remove extreme outliers (optional) with a single mask over all outlier columns
+    outlier_columns = [col for col in ['Indoor_Temperature', 'Outdoor_Temperature', 'Ideal_Temperature']
+                       if col in df_clean.columns]
+    if outlier_columns:
+        values = df_clean[outlier_columns].to_numpy(dtype=float)
+        Q1 = np.quantile(values, 0.01, axis=0)
+        Q3 = np.quantile(values, 0.99, axis=0)
+        mask = ((values >= Q1) & (values <= Q3)).all(axis=1)
+        df_clean = df_clean.loc[mask]
     
     cleaned_size = len(df_clean)
     print(f"Original dataset size: {original_size}")
@@ -158,6 +222,22 @@ def clean_dataset(df):
     
     return df_clean
 
+def get_training_device(regressor):
+    """
+    Report the device XGBoost actually trained on.
+    
+    Args:
+        regressor (xgb.XGBRegressor): Fitted regressor
+        
+    Returns:
+        str: Device from the booster configuration, e.g. 'cpu' or 'cuda:0'
+    """
+    try:
+        config = json.loads(regressor.get_booster().save_config())
+        return config['learner']['generic_param']['device']
+    except (KeyError, ValueError):
+        return 'unknown'
+
 def build_and_train_model(dataset_path):
     """
     Build, train, and evaluate the XGBoost regression model using your dataset.
@@ -205,16 +285,19 @@ def build_and_train_model(dataset_path):
         transformers=[
             ('cat', OneHotEncoder(handle_unknown='ignore', sparse_output=False), categorical_features),
             ('num', 'passthrough', numerical_features)
-        ]
+        ],
+        n_jobs=-1  # Fit/transform the categorical and numerical blocks in parallel
     )
     
-    # Create the complete pipeline with XGBoost
+    # Create the complete pipeline with XGBoost (GPU histogram method when available)
     model_pipeline = Pipeline([
         ('preprocessor', preprocessor),
         ('regressor', xgb.XGBRegressor(
             n_estimators=100,
             max_depth=6,
             learning_rate=0.1,
+            tree_method='hist',
+            device='cuda',
             random_state=42,
             n_jobs=-1
         ))
@@ -234,8 +317,26 @@ def build_and_train_model(dataset_path):
     print(f"\n=== Model Training ===")
     print("Training XGBoost model... This may take a few minutes.")
     
-    model_pipeline.fit(X_train, y_train)
+    # Without a visible GPU, XGBoost usually just warns and trains on CPU instead of
+    # raising, so record its warnings despite the module-level filter
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter('always')
+        try:
+            model_pipeline.fit(X_train, y_train)
+        except xgb.core.XGBoostError as e:
+            print(f"GPU training not available ({str(e).splitlines()[0]}), falling back to CPU...")
+            model_pipeline.set_params(regressor__device='cpu')
+            model_pipeline.fit(X_train, y_train)
+    
+    for caught in caught_warnings:
+        message = str(caught.message)
+        if 'GPU' in message or 'device' in message:
+            print(f"WARNING: {message.strip()}")
     print("Model training completed!")
+    print(f"Training device: {get_training_device(model_pipeline.named_steps['regressor'])}")
+    
+    # Predict and save for CPU so the API does not look for a GPU at inference time
+    model_pipeline.set_params(regressor__device='cpu')
     
     # Make predictions
     print("Making predictions...")
@@ -1,17 +1,31 @@
+"""
+Manual test script for a running instance of the prediction API.
+
+Requires packages that are not in requirements.txt (the API itself does not need them):
+    pip install requests aiohttp
+
+Start the API first (python flask_api.py), then run: python test_api.py
+"""
+import aiohttp
+import asyncio
 import requests
-import json
+import orjson
 import time
 
 # API base URL
 BASE_URL = "http://localhost:5000"
 
+def format_response(response):
+    """Pretty-print a JSON response body."""
+    return orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode()
+
 def test_health_check():
     """Test the health check endpoint."""
     print("Testing health check endpoint...")
     try:
         response = requests.get(f"{BASE_URL}/health")
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {format_response(response)}")
         return response.status_code == 200
     except Exception as e:
         print(f"Error: {e}")
@@ -23,7 +37,7 @@ def test_model_info():
     try:
         response = requests.get(f"{BASE_URL}/model-info")
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {format_response(response)}")
         return response.status_code == 200
     except Exception as e:
         print(f"Error: {e}")
@@ -49,11 +63,11 @@ def test_prediction():
     try:
         headers = {'Content-Type': 'application/json'}
         response = requests.post(f"{BASE_URL}/predict", 
-                               json=test_data, 
+                               data=orjson.dumps(test_data), 
                                headers=headers)
         
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {format_response(response)}")
         return response.status_code == 200
     except Exception as e:
         print(f"Error: {e}")
@@ -79,11 +93,11 @@ def test_prediction_with_invalid_data():
     try:
         headers = {'Content-Type': 'application/json'}
         response = requests.post(f"{BASE_URL}/predict", 
-                               json=invalid_data, 
+                               data=orjson.dumps(invalid_data), 
                                headers=headers)
         
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {format_response(response)}")
         return response.status_code == 400  # Should return 400 for bad request
     except Exception as e:
         print(f"Error: {e}")
@@ -138,29 +152,36 @@ def test_multiple_predictions():
         }
     ]
     
-    results = []
+    # Fire all scenarios concurrently so the server can batch them together
+    return asyncio.run(run_scenarios(test_scenarios))
+
+async def predict_scenario(session, scenario):
+    """Post one scenario to the prediction endpoint and summarize the outcome."""
     headers = {'Content-Type': 'application/json'}
-    
-    for scenario in test_scenarios:
-        try:
-            response = requests.post(f"{BASE_URL}/predict", 
-                                   json=scenario["data"], 
-                                   headers=headers)
+    try:
+        async with session.post(f"{BASE_URL}/predict", 
+                                data=orjson.dumps(scenario["data"]), 
+                                headers=headers) as response:
             
-            if response.status_code == 200:
-                result = response.json()
+            if response.status == 200:
+                result = orjson.loads(await response.read())
                 predicted_temp = result.get('predicted_ideal_temperature', 'N/A')
                 print(f"{scenario['name']}: {predicted_temp}°C")
-                results.append((scenario['name'], predicted_temp))
+                return (scenario['name'], predicted_temp)
             else:
-                print(f"{scenario['name']}: Error - {response.status_code}")
-                results.append((scenario['name'], 'Error'))
+                print(f"{scenario['name']}: Error - {response.status}")
+                return (scenario['name'], 'Error')
                 
-        except Exception as e:
-            print(f"{scenario['name']}: Exception - {e}")
-            results.append((scenario['name'], 'Exception'))
-    
-    return results
+    except Exception as e:
+        print(f"{scenario['name']}: Exception - {e}")
+        return (scenario['name'], 'Exception')
+
+async def run_scenarios(test_scenarios):
+    """Send all scenarios concurrently over one keep-alive session."""
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(
+            *(predict_scenario(session, scenario) for scenario in test_scenarios)
+        )
 
 def run_all_tests():
     """Run all API tests."""
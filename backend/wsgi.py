@@ -0,0 +1,11 @@
+"""
+WSGI entry point for serving the API with Gunicorn and gevent workers.
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+# Patch the standard library before Flask, the model and the batching thread are imported
+from gevent import monkey
+monkey.patch_all()
+
+from flask_api import app  # noqa: E402  (importing flask_api loads the model)
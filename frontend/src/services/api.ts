@@ -12,7 +12,6 @@ export interface PredictionInput {
 
 export interface PredictionSuccessResponse {
   predicted_ideal_temperature: number;
-  input_features: PredictionInput;
   timestamp: string;
   status: 'success';
 }